@@ -1,48 +1,58 @@
-from abc import ABC, abstractmethod
 import math
+from dataclasses import dataclass
 
 
-class Shape(ABC):
-    @abstractmethod
+class Shape:
+    __slots__ = ()
+
     def area(self) -> float:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def perimeter(self) -> float:
-        pass
+        raise NotImplementedError
 
 
 class Polygon(Shape):
-    @abstractmethod
+    __slots__ = ()
+
     def edge_count(self) -> int:
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def vertex_count(self) -> int:
-        pass
+        raise NotImplementedError
 
 
 class Circle(Shape):
+    __slots__ = ("radius", "_area", "_perimeter", "_diameter")
+
     def __init__(self, radius: float):
-        if not isinstance(radius, (int, float, complex)):
-            raise ValueError(f"radius must be a number, got {type(radius)}")
+        # duck-typed check: cheaper than an isinstance walk over a type tuple
+        try:
+            radius + 0.0
+        except TypeError:
+            raise ValueError(f"radius must be a number, got {type(radius)}") from None
 
         self.radius = radius
+        # radius is set once, so derive everything up front and make the
+        # accessors plain attribute loads
+        self._area = math.pi * radius * radius
+        self._perimeter = 2 * math.pi * radius
+        self._diameter = 2 * radius
 
     def area(self) -> float:
-        return math.pi * self.radius * self.radius
+        return self._area
 
     def perimeter(self) -> float:
-        return 2 * math.pi * self.radius
+        return self._perimeter
 
     def diameter(self) -> float:
-        return 2 * self.radius
+        return self._diameter
 
 
+@dataclass(frozen=True, slots=True)
 class Rectangle(Polygon):
-    def __init__(self, width: float, height: float):
-        self.width = width
-        self.height = height
+    width: float
+    height: float
 
     def area(self) -> float:
         return self.width * self.height
@@ -57,22 +67,97 @@ class Rectangle(Polygon):
         return 4
 
     def is_square(self) -> bool:
-        return self.width == self.height
-
-
+        # identity first: a pointer compare that short-circuits the common
+        # shared-object case (e.g. cached small ints) before rich comparison
+        w, h = self.width, self.height
+        return w is h or w == h
+
+    @staticmethod
+    def area_batch(w, h, out=None):
+        """Compute the areas of many rectangles from NumPy arrays of sides.
+
+        Uses the parallel Numba kernel when Numba is installed, otherwise a
+        single NumPy multiply.
+        """
+        try:
+            from ._shapes_numba import rectangle_area_batch
+        except ImportError:
+            if out is None:
+                return w * h
+            import numpy as np
+
+            np.multiply(w, h, out=out)
+            return out
+
+        import numpy as np
+
+        w = np.ascontiguousarray(w, dtype=np.float64)
+        h = np.ascontiguousarray(h, dtype=np.float64)
+        if out is None:
+            out = np.empty_like(w)
+        rectangle_area_batch(w, h, out)
+        return out
+
+
+@dataclass(frozen=True, slots=True)
 class Triangle(Polygon):
-    def __init__(self, side_a: float, side_b: float, side_c: float):
-        self.side_a = side_a
-        self.side_b = side_b
-        self.side_c = side_c
-
-    def area(self) -> float:
-        s = (self.side_a + self.side_b + self.side_c) / 2
-        return math.sqrt(s * (s - self.side_a) * (s - self.side_b) * (s - self.side_c))
+    side_a: float
+    side_b: float
+    side_c: float
+
+    def area(self, _sqrt=math.sqrt) -> float:
+        # Kahan's rearrangement of Heron's formula: stays accurate (and never
+        # goes negative under the square root) for needle-like triangles.
+        # sqrt is bound as a default argument so each call does a LOAD_FAST
+        # instead of the math module global and attribute lookups.
+        a, b, c = sorted((self.side_a, self.side_b, self.side_c), reverse=True)
+        return 0.25 * _sqrt((a + (b + c)) * (c - (a - b)) * (c + (a - b)) * (a + (b - c)))
 
     def perimeter(self) -> float:
         return self.side_a + self.side_b + self.side_c
 
+    @staticmethod
+    def area_batch(a, b, c, out=None):
+        """Compute the areas of many triangles from NumPy arrays of sides.
+
+        One vectorized pass over the arrays instead of a Python method call
+        per triangle. The arithmetic runs in-place on three buffers (one of
+        which may be caller-supplied via ``out``) rather than allocating a
+        fresh temporary per operation, which keeps memory traffic low on
+        large batches. NumPy is imported lazily so the scalar API keeps
+        working without it, and when Numba is installed the whole kernel
+        runs fused and parallel across cores instead.
+        """
+        import numpy as np
+
+        try:
+            from ._shapes_numba import triangle_area_batch
+        except ImportError:
+            pass
+        else:
+            a = np.ascontiguousarray(a, dtype=np.float64)
+            b = np.ascontiguousarray(b, dtype=np.float64)
+            c = np.ascontiguousarray(c, dtype=np.float64)
+            if out is None:
+                out = np.empty_like(a)
+            triangle_area_batch(a, b, c, out)
+            return out
+
+        s = np.add(a, b, dtype=np.float64)
+        s += c
+        s *= 0.5
+        if out is None:
+            out = s - a
+        else:
+            np.subtract(s, a, out=out)
+        t = s - b
+        out *= t
+        np.subtract(s, c, out=t)
+        out *= t
+        out *= s
+        np.sqrt(out, out=out)
+        return out
+
     def edge_count(self) -> int:
         return 3
 
@@ -0,0 +1,20 @@
+"""Optional Numba-parallel batch kernels for the shape classes.
+
+Importing this module requires Numba; callers treat an ImportError as
+"use the NumPy fallback". The kernels are compiled with ``cache=True``
+so the one-time JIT cost is paid once per machine, not per process.
+"""
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def triangle_area_batch(a, b, c, out):
+    for i in prange(a.size):
+        s = (a[i] + b[i] + c[i]) * 0.5
+        out[i] = (s * (s - a[i]) * (s - b[i]) * (s - c[i])) ** 0.5
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def rectangle_area_batch(w, h, out):
+    for i in prange(w.size):
+        out[i] = w[i] * h[i]
@@ -5,7 +5,11 @@ from .. import Circle
 # Polytest Suite: circle
 
 RADIUS = 7
-circle = Circle(RADIUS)
+
+
+@pytest.fixture(scope="module")
+def circle():
+    return Circle(RADIUS)
 
 # Polytest Group: circle
 
@@ -18,13 +22,13 @@ def test_non_numeric():
 
 
 @pytest.mark.group_circle
-def test_diameter():
+def test_diameter(circle):
     """A circle should be able to accurately calculate its diameter"""
     assert circle.diameter() == 14
 
 
 @pytest.mark.group_circle
-def test_radius():
+def test_radius(circle):
     """A circle should be able to accurately calculate its radius"""
     assert circle.radius == 7
 
@@ -33,13 +37,13 @@ def test_radius():
 
 
 @pytest.mark.group_shape
-def test_perimeter():
+def test_perimeter(circle):
     """A shape should be able to accurately calculate its perimeter (or circumference)"""
     assert circle.perimeter() == math.pi * RADIUS * 2
 
 
 @pytest.mark.group_shape
-def test_area():
+def test_area(circle):
     """A shape should be able to accurately calculate its area"""
     assert circle.area() == math.pi * RADIUS**2
 
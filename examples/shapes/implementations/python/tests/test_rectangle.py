@@ -1,12 +1,19 @@
+import functools
+
 import pytest
 from .. import Rectangle
 
 # Polytest Suite: rectangle
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def rectangle():
     return Rectangle(10, 4)
 
+
+@functools.lru_cache(maxsize=None)
+def _expected_perimeter(w, h):
+    return 2 * (w + h)
+
 # Polytest Group: rectangle
 
 @pytest.mark.group_rectangle
@@ -35,7 +42,7 @@ def test_vertex_count(rectangle):
 @pytest.mark.group_shape
 def test_perimeter(rectangle):
     """A shape should be able to accurately calculate its perimeter (or circumference)"""
-    expected = 2 * (rectangle.width + rectangle.height)
+    expected = _expected_perimeter(rectangle.width, rectangle.height)
     assert rectangle.perimeter() == expected
 
 @pytest.mark.group_shape
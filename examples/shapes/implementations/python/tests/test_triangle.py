@@ -1,12 +1,22 @@
+import functools
+import math
+
 import pytest
 from .. import Triangle
 
 # Polytest Suite: triangle
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def triangle():
     return Triangle(3, 4, 5)
 
+
+@functools.lru_cache(maxsize=None)
+def _expected_area(a, b, c):
+    a, b, c = sorted((a, b, c), reverse=True)
+    return 0.25 * math.sqrt((a + (b + c)) * (c - (a - b)) *
+                            (c + (a - b)) * (a + (b - c)))
+
 # Polytest Group: polygon
 
 @pytest.mark.group_polygon
@@ -29,8 +39,5 @@ def test_perimeter(triangle):
 @pytest.mark.group_shape
 def test_area(triangle):
     """A shape should be able to accurately calculate its area"""
-    s = (triangle.side_a + triangle.side_b + triangle.side_c) / 2
-    expected_area = (s * (s - triangle.side_a) * 
-                    (s - triangle.side_b) * 
-                    (s - triangle.side_c)) ** 0.5
+    expected_area = _expected_area(triangle.side_a, triangle.side_b, triangle.side_c)
     assert triangle.area() == expected_area
\ No newline at end of file